@@ -0,0 +1,11 @@
+"""Endpoint configuration for the eval suite, read once at import.
+
+Both conftest.py and master_agent/agent.py used to call os.getenv for the
+same URLs with their own defaults; keeping them here gives one place to
+change and precomputes derived URLs like the agent card.
+"""
+import os
+
+API_URL = os.getenv("AGENT_API_URL", "http://localhost:8080")
+A2A_URL = os.getenv("AGENT_A2A_URL", "http://localhost:8001")
+AGENT_CARD_URL = f"{A2A_URL}/.well-known/agent-card.json"
@@ -0,0 +1,115 @@
+"""Shared fixtures for the Agent Registry eval suite.
+
+These tests run against a live agent deployment; point AGENT_API_URL at the
+agent's HTTP API (defaults to the local dev setup).
+"""
+import itertools
+import os
+import socket
+import uuid
+from urllib.parse import urlparse
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from _config import API_URL
+
+
+def _pin_to_ip(url):
+    """Rewrite the URL host to its resolved IP so requests skip DNS.
+
+    Resolution happens once at import; each xdist worker pays one lookup
+    instead of one per request. Falls back to the hostname if it does not
+    resolve (e.g. the health gate will skip the session anyway).
+    """
+    parsed = urlparse(url)
+    try:
+        ip = socket.gethostbyname(parsed.hostname)
+    except (socket.gaierror, TypeError):
+        return url
+    netloc = f"{ip}:{parsed.port}" if parsed.port else ip
+    return parsed._replace(netloc=netloc).geturl()
+
+
+API_URL_IP = _pin_to_ip(API_URL)
+
+
+@pytest.fixture(scope="session")
+def a2a_agent():
+    """The shared RemoteA2aAgent wrapping the deployed master agent.
+
+    Importing master_agent here (once per session) is what triggers the
+    agent-card fetch and A2A handshake; every AgentEvaluator run that
+    references agent_module="master_agent" then reuses the same instance.
+    """
+    from master_agent.agent import get_root_agent
+
+    return get_root_agent()
+
+
+@pytest.fixture(scope="session")
+def run_id():
+    """One random tag per session; all event IDs derive from it.
+
+    A single urandom read replaces one uuid4() syscall per test, and the
+    monotonic suffixes make per-run log correlation easier.
+    """
+    return uuid.uuid4().hex[:6]
+
+
+@pytest.fixture(scope="session")
+def event_tag(run_id):
+    """Callable yielding unique tags like "a1b2c3-0004".
+
+    Session-scoped so the counter never restarts mid-run and tags stay
+    unique across tests.
+    """
+    counter = itertools.count()
+    return lambda: f"{run_id}-{next(counter):04x}"
+
+
+@pytest.fixture(scope="session")
+def worker_id():
+    """Identifier of the current pytest-xdist worker ("gw0" when serial).
+
+    Tests bake this into event sources so parallel workers never race on
+    each other's world-state deltas.
+    """
+    return os.getenv("PYTEST_XDIST_WORKER", "gw0")
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def http_client():
+    """Session-wide pooled async HTTP client; doubles as the agent health gate.
+
+    A single connection pool is shared by every test, so the suite pays for
+    TCP/TLS setup and DNS resolution once per run instead of once per probe,
+    and tests can fire event pushes concurrently with asyncio.gather. If the
+    agent is unreachable the whole session is skipped up front.
+    """
+    client = httpx.AsyncClient(
+        base_url=API_URL_IP,
+        timeout=httpx.Timeout(30.0, connect=1.0),
+        # With h2 multiplexing, concurrent probes share streams on one
+        # connection; a small pool suffices, and the long keepalive_expiry
+        # keeps the socket hot for h1-only agents. The pool knobs must live
+        # on the transport: with an explicit transport, httpx silently
+        # ignores a client-level limits= argument.
+        transport=httpx.AsyncHTTPTransport(
+            retries=2,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8, keepalive_expiry=60),
+        ),
+    )
+    try:
+        # The probe gets its own tight budget (0.5s connect, 2s read) so a
+        # down or still-booting agent skips the session quickly; transient
+        # TCP errors are absorbed by the transport's retries.
+        probe_timeout = httpx.Timeout(2.0, connect=0.5)
+        (await client.get("/v0/agent/status", timeout=probe_timeout)).raise_for_status()
+    except httpx.HTTPError as exc:
+        await client.aclose()
+        pytest.skip(f"agent not reachable at {API_URL}: {exc}")
+    yield client
+    await client.aclose()
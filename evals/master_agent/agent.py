@@ -0,0 +1,41 @@
+"""ADK agent module pointing AgentEvaluator at the deployed master agent.
+
+The agent itself runs out-of-process and is reached over A2A; this module
+only wraps its card URL in a RemoteA2aAgent so ADK eval datasets can be
+replayed against it.
+"""
+import functools
+
+from a2a.client import ClientConfig, ClientFactory
+from google.adk.agents.remote_a2a_agent import RemoteA2aAgent
+
+from _config import AGENT_CARD_URL
+
+# One streaming client factory for the whole process; every evaluator run
+# shares its connection state instead of rebuilding it per call.
+A2A_CLIENT_FACTORY = ClientFactory(config=ClientConfig(streaming=True))
+
+
+@functools.lru_cache(maxsize=1)
+def get_root_agent():
+    """Build the RemoteA2aAgent once per process.
+
+    Construction fetches the agent card and sets up the A2A streaming
+    client, so every eval run must share the same instance instead of
+    re-handshaking per test.
+    """
+    return RemoteA2aAgent(
+        name="master_agent",
+        description="Master agent that triages infrastructure events into incidents.",
+        agent_card=AGENT_CARD_URL,
+        a2a_client_factory=A2A_CLIENT_FACTORY,
+    )
+
+
+def __getattr__(name):
+    # Resolve root_agent lazily so merely importing this module (pytest
+    # collection, -k filtering) opens no A2A connections; ADK's
+    # agent_module lookup still finds the attribute through here.
+    if name == "root_agent":
+        return get_root_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
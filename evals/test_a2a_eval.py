@@ -0,0 +1,18 @@
+"""A2A evals replaying ADK datasets against the deployed master agent."""
+import pathlib
+
+import pytest
+from google.adk.evaluation.agent_evaluator import AgentEvaluator
+
+EVAL_DIR = pathlib.Path(__file__).parent / "master_agent"
+
+
+# One parametrized test instead of one function per dataset: the session
+# event loop and the warmed-up agent carry over between cases, so the
+# LLM/session warm-up is paid once for the whole suite.
+@pytest.mark.parametrize("dataset", ["triage_basic.test.json", "multi_event.test.json"])
+async def test_eval(dataset, a2a_agent):
+    await AgentEvaluator.evaluate(
+        agent_module="master_agent",
+        eval_dataset_file_path_or_dir=str(EVAL_DIR / dataset),
+    )
@@ -0,0 +1,143 @@
+"""HTTP evals for the master agent event pipeline.
+
+Pushes events through POST /v0/agent/events and checks that the agent's
+world state on GET /v0/agent/status reflects them.
+
+The tests touch disjoint, per-worker event sources, so they are safe to
+run in parallel: `pytest -n 3 evals/test_http_events.py`.
+"""
+import asyncio
+import time
+
+import orjson
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+def make_event(source, event_type="pod-restart", severity="warning", message=None):
+    return {
+        "source": source,
+        "type": event_type,
+        "severity": severity,
+        "message": message or f"{event_type} observed on {source}",
+    }
+
+
+# Canonical payloads whose content never varies per run are encoded once at
+# import, so the hot path is a bare POST of precomputed bytes. Under xdist
+# each worker pays the encode once instead of per invocation.
+_DRAIN_BODY = orjson.dumps(
+    make_event("k8s/pod/default/drain-test", severity="info", message="Pod drain-test restarted")
+)
+_NO_SOURCE_BODY = orjson.dumps(
+    {"type": "pod-restart", "severity": "info", "message": "no source"}
+)
+_BAD_SEVERITY_BODY = orjson.dumps(
+    make_event("k8s/pod/default/bad-severity", severity="catastrophic")
+)
+
+
+async def post_event(client, body):
+    """POST one event, serialized with orjson instead of stdlib json."""
+    return await client.post("/v0/agent/events", content=orjson.dumps(body), headers=JSON_HEADERS)
+
+
+async def push_events(client, events):
+    """Submit a batch of events in one HTTP round-trip.
+
+    Uses POST /v0/agent/events:batch so N events cost one RTT instead of
+    N; single-event tests keep the plain endpoint, but load-style evals
+    should go through this.
+    """
+    resp = await client.post(
+        "/v0/agent/events:batch", content=orjson.dumps(events), headers=JSON_HEADERS
+    )
+    resp.raise_for_status()
+    return resp
+
+
+async def push_concurrently(client, events, limit=16):
+    """Fire individual event posts concurrently, bounded by a semaphore."""
+    sem = asyncio.Semaphore(limit)
+
+    async def _push(event):
+        async with sem:
+            return await post_event(client, event)
+
+    return await asyncio.gather(*(_push(e) for e in events))
+
+
+async def status(client):
+    """Fetch and decode /v0/agent/status with orjson.
+
+    Streams the body instead of materializing a cached Response.content;
+    the status document grows with the incidents list, and wait_for may
+    hit this hundreds of times per run.
+    """
+    async with client.stream("GET", "/v0/agent/status") as resp:
+        body = b"".join([chunk async for chunk in resp.aiter_bytes()])
+    return orjson.loads(body)
+
+
+async def wait_for(client, predicate, timeout=15, interval=0.1):
+    """Poll /v0/agent/status until predicate(status) is true.
+
+    Returns the status document as soon as the predicate holds, so tests
+    finish the moment the agent catches up instead of sleeping a fixed
+    worst-case interval. Backs off exponentially to keep the request rate
+    low on slow runs.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        doc = await status(client)
+        if predicate(doc):
+            return doc
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"agent status did not converge within {timeout}s")
+        await asyncio.sleep(interval)
+        interval = min(interval * 1.5, 0.5)
+
+
+def source_seen(doc, source):
+    return any(e.get("source") == source for e in doc["worldState"].get("recentEvents", []))
+
+
+class TestPushEventAndCheckStatus:
+    async def test_push_event_updates_status(self, http_client, worker_id, event_tag):
+        source = f"k8s/pod/staging/{worker_id}-api-eval-{event_tag()}"
+        resp = await post_event(http_client, make_event(source))
+        assert resp.status_code in (200, 202)
+
+        # Wait on our own source rather than the global totalEvents counter,
+        # which other workers bump concurrently.
+        await wait_for(http_client, lambda s: source_seen(s, source))
+
+    async def test_event_creates_incident(self, http_client, worker_id, event_tag):
+        baseline = (await status(http_client))["worldState"]["activeIncidents"]
+        source = f"k8s/pod/staging/{worker_id}-db-eval-{event_tag()}"
+        event = make_event(source, event_type="crash-loop", severity="error")
+        resp = await post_event(http_client, event)
+        assert resp.status_code in (200, 202)
+
+        await wait_for(http_client, lambda s: s["worldState"]["activeIncidents"] >= baseline + 1)
+
+    async def test_queue_depth_decreases(self, http_client):
+        responses = await asyncio.gather(
+            *(
+                http_client.post("/v0/agent/events", content=_DRAIN_BODY, headers=JSON_HEADERS)
+                for _ in range(3)
+            )
+        )
+        assert all(r.status_code in (200, 202) for r in responses)
+
+        await wait_for(http_client, lambda s: s["queue"]["depth"] == 0)
+
+
+class TestEventValidation:
+    async def test_rejects_event_without_source(self, http_client):
+        resp = await http_client.post("/v0/agent/events", content=_NO_SOURCE_BODY, headers=JSON_HEADERS)
+        assert resp.status_code in (400, 422)
+
+    async def test_rejects_unknown_severity(self, http_client):
+        resp = await http_client.post("/v0/agent/events", content=_BAD_SEVERITY_BODY, headers=JSON_HEADERS)
+        assert resp.status_code in (400, 422)
@@ -3,10 +3,33 @@
 Simple MCP client to test Agent Registry MCP tools
 """
 import json
+import os
+import sys
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+
+    def _pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _pretty(obj):
+        return json.dumps(obj, indent=2)
 
 MCP_URL = "http://localhost:8083"
 
+# Pretty-printing big tool results dominates CPU time; only do it on demand.
+VERBOSE = os.getenv("MCP_VERBOSE") == "1"
+
+# One session for the whole script: every call reuses the same pooled
+# TCP connection instead of paying a fresh handshake per request.
+SESSION = requests.Session()
+SESSION.headers.update({"Content-Type": "application/json"})
+SESSION.mount(MCP_URL, HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
 def call_mcp_tool(tool_name, arguments=None):
     """Call an MCP tool via SSE transport"""
     payload = {
@@ -19,27 +42,59 @@ def call_mcp_tool(tool_name, arguments=None):
         }
     }
 
-    print(f"\n{'='*60}")
-    print(f"Calling tool: {tool_name}")
-    print(f"Arguments: {json.dumps(arguments, indent=2)}")
-    print(f"{'='*60}\n")
+    parts = [f"\n{'='*60}\n", f"Calling tool: {tool_name}\n"]
+    if VERBOSE:
+        parts.append(f"Arguments: {_pretty(arguments)}\n")
+    parts.append(f"{'='*60}\n\n")
 
-    response = requests.post(
-        f"{MCP_URL}/message",
-        json=payload,
-        headers={"Content-Type": "application/json"}
-    )
+    response = SESSION.post(f"{MCP_URL}/message", json=payload)
 
     if response.status_code == 200:
         result = response.json()
-        print("✓ Success!")
-        print(json.dumps(result, indent=2))
+        parts.append("✓ Success!\n")
+        if VERBOSE:
+            parts.append(_pretty(result) + "\n")
+        sys.stdout.write("".join(parts))
         return result
     else:
-        print(f"✗ Error: {response.status_code}")
-        print(response.text)
+        parts.append(f"✗ Error: {response.status_code}\n")
+        parts.append(response.text + "\n")
+        sys.stdout.write("".join(parts))
         return None
 
+def get_total_events():
+    """Fetch worldState.totalEvents via the status tool, without printing."""
+    payload = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {"name": "get_master_agent_status", "arguments": {}}
+    }
+    response = SESSION.post(f"{MCP_URL}/message", json=payload)
+    if response.status_code != 200:
+        return None
+    try:
+        text = response.json()["result"]["content"][0]["text"]
+        return json.loads(text)["worldState"]["totalEvents"]
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+
+
+def wait_for_delta(baseline, timeout=3.0, interval=0.1):
+    """Poll until totalEvents moves past baseline instead of sleeping blind.
+
+    Returns True as soon as the agent has processed the event; False if the
+    counter never moved within timeout (same worst case as the old sleep).
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        total = get_total_events()
+        if total is not None and (baseline is None or total > baseline):
+            return True
+        time.sleep(interval)
+    return False
+
+
 def list_tools():
     """List available MCP tools"""
     payload = {
@@ -49,28 +104,24 @@ def list_tools():
         "params": {}
     }
 
-    print(f"\n{'='*60}")
-    print("Listing available MCP tools")
-    print(f"{'='*60}\n")
+    parts = [f"\n{'='*60}\n", "Listing available MCP tools\n", f"{'='*60}\n\n"]
 
-    response = requests.post(
-        f"{MCP_URL}/message",
-        json=payload,
-        headers={"Content-Type": "application/json"}
-    )
+    response = SESSION.post(f"{MCP_URL}/message", json=payload)
 
     if response.status_code == 200:
         result = response.json()
         if "result" in result and "tools" in result["result"]:
             tools = result["result"]["tools"]
-            print(f"Found {len(tools)} tools:")
+            parts.append(f"Found {len(tools)} tools:\n")
             for tool in tools:
                 if "master" in tool["name"] or "event" in tool["name"]:
-                    print(f"  - {tool['name']}: {tool.get('description', 'No description')}")
+                    parts.append(f"  - {tool['name']}: {tool.get('description', 'No description')}\n")
+        sys.stdout.write("".join(parts))
         return result
     else:
-        print(f"✗ Error: {response.status_code}")
-        print(response.text)
+        parts.append(f"✗ Error: {response.status_code}\n")
+        parts.append(response.text + "\n")
+        sys.stdout.write("".join(parts))
         return None
 
 if __name__ == "__main__":
@@ -82,6 +133,7 @@ if __name__ == "__main__":
 
     # 2. Get master agent status
     call_mcp_tool("get_master_agent_status")
+    baseline = get_total_events()
 
     # 3. Emit a test event
     call_mcp_tool("emit_event", {
@@ -91,10 +143,10 @@ if __name__ == "__main__":
         "source": "mcp-test-client"
     })
 
-    # Wait a moment for processing
-    print("\n⏳ Waiting 3 seconds for master agent to process event...")
-    import time
-    time.sleep(3)
+    # Wait for the master agent to pick the event up, but no longer than needed
+    print("\n⏳ Waiting for master agent to process event...")
+    if not wait_for_delta(baseline):
+        print("⚠ totalEvents did not increase within timeout; continuing anyway")
 
     # 4. Get status again to see changes
     call_mcp_tool("get_master_agent_status")